@@ -53,6 +53,8 @@
 
 import usb.core
 import usb.util
+import array
+import struct
 import sys
 import time
 import argparse
@@ -81,6 +83,8 @@ def _main():
         sys.exit(0)
 
     # Switch WCH-Link to RISC-V mode
+    isp     = None
+    linkerr = None
     try:
         if args.rvmode:
             print('Searching for WCH-Link in ARM mode ...')
@@ -90,8 +94,25 @@ def _main():
             print('SUCCESS: Found WCH-Link in ARM mode.')
             print('Switching WCH-Link to RISC-V mode ...')
             armlink.write(0x02, b'\x81\xff\x01\x52')
-            time.sleep(2)
-            print('DONE.')
+            # Wait up to 3s for the Link to re-enumerate and accept commands
+            # (a Link that does not answer is not retried, each try would block for CH_TIMEOUT)
+            rvlink   = None
+            deadline = time.monotonic() + 3
+            while isp is None and time.monotonic() < deadline:
+                time.sleep(0.1)
+                if rvlink is None:
+                    rvlink = usb.core.find(idVendor = CH_VENDOR_ID, idProduct = CH_PRODUCT_ID)
+                if rvlink is not None:
+                    try:    isp = Programmer(rvlink)
+                    except  usb.core.USBTimeoutError as ex:
+                        linkerr = ex
+                        break
+                    except  usb.core.USBError as ex:
+                        linkerr = ex
+            if rvlink is None:
+                raise Exception('WCH-Link did not show up in RISC-V mode')
+            if isp is not None:
+                print('DONE.')
 
     except Exception as ex:
         sys.stderr.write('ERROR: ' + str(ex) + '!\n')
@@ -99,7 +120,10 @@ def _main():
     # Establish connection to WCH-Link
     try:
         print('Searching for WCH-Link in RISC-V mode ...')
-        isp = Programmer()
+        if isp is None:
+            if linkerr is not None:
+                raise linkerr
+            isp = Programmer()
         print('SUCCESS: Found', isp.linkname, 'v' + isp.linkversion + ' in RISC-V mode.')
     except Exception as ex:
         sys.stderr.write('ERROR: ' + str(ex) + '!\n')
@@ -184,12 +208,17 @@ def _main():
 # ===================================================================================
 
 class Programmer:
-    # Init programmer
-    def __init__(self):
+    # Init programmer (dev: already found WCH-Link in RISC-V mode, optional)
+    def __init__(self, dev = None):
         # Find programmer
-        self.dev = usb.core.find(idVendor = CH_VENDOR_ID, idProduct = CH_PRODUCT_ID)
+        if dev is None:
+            dev = usb.core.find(idVendor = CH_VENDOR_ID, idProduct = CH_PRODUCT_ID)
+        self.dev = dev
         if self.dev is None:
             raise Exception('WCH-Link not found. Check if device is in RISC-V mode')
+        self.usbwrite = self.dev.write
+        self.usbread  = self.dev.read
+        self.rxbuf    = array.array('B', bytes(CH_PACKET_SIZE))
 
         # Clear receive buffers
         self.clearreply()
@@ -214,20 +243,21 @@ class Programmer:
     # Connect programmer to MCU
     def connect(self):
         # Connect to target MCU and get type
+        # (retry with backoff from 5ms up to 100ms, about 550ms in total)
         success = 0
-        for _ in range(3):
+        delay   = 0.005
+        for attempt in range(10):
+            if attempt:
+                time.sleep(delay)
+                delay = min(delay * 2, 0.1)
             reply = self.sendcommand(b'\x81\x0d\x01\x02')
-            if len(reply) < 8 or set(reply[:4]) == set((0x81, 0x55, 0x01, 0x01)):
-                time.sleep(0.2)
-                continue
-            self.chipseries =  reply[4]<<4
-            self.chiptype   = (reply[4]<<4) + (reply[5]>>4)
-            self.chipname   = 'CH32V%03x' % self.chiptype
-            if self.chipseries not in (0x000, 0x200, 0x300):
-                time.sleep(0.2)
-                continue
-            success = 1
-            break
+            if len(reply) >= 8 and bytes(reply[:4]) != b'\x81\x55\x01\x01':
+                self.chipseries =  reply[4]<<4
+                self.chiptype   = (reply[4]<<4) + (reply[5]>>4)
+                self.chipname   = 'CH32V%03x' % self.chiptype
+                if self.chipseries in (0x000, 0x200, 0x300):
+                    success = 1
+                    break
         if success == 0:
             raise Exception('Failed to connect to target MCU')
 
@@ -236,34 +266,36 @@ class Programmer:
             reply = self.sendcommand(b'\x81\x11\x01\x09')
         else:
             reply = self.sendcommand(b'\x81\x11\x01\x05')
-        self.flashsize = int.from_bytes(reply[2:4], byteorder='big') * 1024
+        self.flashsize = CH_U16_BE.unpack_from(reply, 2)[0] * 1024
 
-    # Send command to programmer
+    # Send command to programmer (array is passed to libusb without conversion)
+    # The reply is a view into the receive buffer, valid until the next command
     def sendcommand(self, stream):
-        self.dev.write(CH_EP_OUT, stream)
-        return self.dev.read(CH_EP_IN, CH_PACKET_SIZE, CH_TIMEOUT)
+        self.usbwrite(CH_EP_OUT, array.array('B', stream))
+        length = self.usbread(CH_EP_IN, self.rxbuf, CH_TIMEOUT)
+        return memoryview(self.rxbuf)[:length]
 
-    # Clear USB receive buffers
+    # Clear USB receive buffers (1ms timeout, libusb treats 0 as infinite)
     def clearreply(self):
-        try:    self.dev.read(CH_EP_IN, CH_PACKET_SIZE, 1)
-        except: None
-        try:    self.dev.read(CH_EP_IN_RAW, CH_PACKET_SIZE, 1)
-        except: None
+        try:    self.usbread(CH_EP_IN, CH_PACKET_SIZE, 1)
+        except  usb.core.USBError: pass
+        try:    self.usbread(CH_EP_IN_RAW, CH_PACKET_SIZE, 1)
+        except  usb.core.USBError: pass
 
     # Write to MCU register
     def writereg(self, addr, data):
-        stream = bytes((0x81, 0x08, 0x06, addr)) + data.to_bytes(4, byteorder='big') + b'\x02'
+        stream = CH_CMD_REG.pack(0x81, 0x08, 0x06, addr, data, 0x02)
         reply = self.sendcommand(stream)
         if (len(reply) != 9) or (reply[3] != addr):
             raise Exception('Failed to write register')
 
     # Read from MCU register
     def readreg(self, addr):
-        stream = (0x81, 0x08, 0x06, addr, 0, 0, 0, 0, 1)
+        stream = CH_CMD_REG.pack(0x81, 0x08, 0x06, addr, 0, 0x01)
         reply = self.sendcommand(stream)
         if (len(reply) != 9) or (reply[3] != addr):
             raise Exception('Failed to read register')
-        return int.from_bytes(reply[4:8], byteorder='big')
+        return CH_U32_BE.unpack_from(reply, 4)[0]
 
     # Unbrick MCU
     def unbrick(self):
@@ -322,65 +354,64 @@ class Programmer:
 
     #--------------------------------------------------------------
 
-    # Get padded data length
+    # Get padded data length (pagesize must be a power of two)
     def padlen(self, data, pagesize):
-        if (len(data) % pagesize) == 0:
-            return len(data)
-        else:
-            return (len(data) + (pagesize - (len(data) % pagesize)))
-
-    # Pad data and divide into pages
-    def page_data(self, data, pagesize):
-        if (len(data) % pagesize) > 0:
-            data += b'\xff' * (pagesize - (len(data) % pagesize))
-        result = list()
-        while len(data):
-            result.append(data[:pagesize])
-            data = data[pagesize:]
+        return (len(data) + pagesize - 1) & -pagesize
+
+    # Pad data to a multiple of pagesize (returns array, PyUSB uses it without copy)
+    def pad_data(self, data, pagesize):
+        result = array.array('B', data)
+        result.frombytes(b'\xff' * (self.padlen(data, pagesize) - len(data)))
         return result
 
+    # Get flash bootloader padded to 128 bytes (decoded on first use, then reused)
+    def getbootloader(self, bootloader):
+        if bootloader not in BOOTLOADER_CACHE:
+            BOOTLOADER_CACHE[bootloader] = self.pad_data(bytes.fromhex(bootloader), 128)
+        return BOOTLOADER_CACHE[bootloader]
+
+    # Write data to raw endpoint using as few bulk transfers as possible
+    def writeraw(self, data):
+        if len(data) == 0:
+            return
+        if len(data) <= CH_MAX_TRANSFER:
+            self.usbwrite(CH_EP_OUT_RAW, data, CH_TIMEOUT)
+            return
+        for i in range(0, len(data), CH_MAX_TRANSFER):
+            self.usbwrite(CH_EP_OUT_RAW, data[i:i+CH_MAX_TRANSFER], CH_TIMEOUT)
+
     # Write data blob to flash, 64-byte aligned (CH32V003)
     def writebinaryblob003(self, addr, data):
         if addr & 63:
             raise Exception('Blob is not 64-byte aligned')
+        data = self.pad_data(data, 64)
         self.unlock()
-        stream = b'\x81\x01\x08' \
-               + addr.to_bytes(4, byteorder='big') \
-               + self.padlen(data, 64).to_bytes(4, byteorder='big')
+        stream = CH_CMD_BLOB.pack(b'\x81\x01\x08', addr, len(data))
         self.sendcommand(stream)
         self.sendcommand(b'\x81\x02\x01\x05')
-        pages = self.page_data(BOOTLOADER003, 128)
-        for page in pages:
-            self.dev.write(CH_EP_OUT_RAW, page)
+        self.writeraw(self.getbootloader(BOOTLOADER003))
         self.sendcommand(b'\x81\x02\x01\x07')
         self.sendcommand(b'\x81\x02\x01\x04')
-        pages = self.page_data(data, 64)
-        for page in pages:
-            self.dev.write(CH_EP_OUT_RAW, page)
-        reply = self.dev.read(CH_EP_IN_RAW, CH_PACKET_SIZE, CH_TIMEOUT)
-        if set(reply) != set((0x41, 0x01, 0x01, 0x04)):
+        self.writeraw(data)
+        reply = self.usbread(CH_EP_IN_RAW, CH_PACKET_SIZE, CH_TIMEOUT)
+        if bytes(reply[:4]) != b'\x41\x01\x01\x04':
             raise Exception('Failed writing/verifying data blob')
 
     # Write data blob to flash, 256-byte aligned (CH32V20x/30x)
     def writebinaryblob203(self, addr, data):
         if addr & 255:
             raise Exception('Blob is not 256-byte aligned')
+        data = self.pad_data(data, 256)
         self.unlock()
-        stream = b'\x81\x01\x08' \
-               + addr.to_bytes(4, byteorder='big') \
-               + self.padlen(data, 256).to_bytes(4, byteorder='big')
+        stream = CH_CMD_BLOB.pack(b'\x81\x01\x08', addr, len(data))
         self.sendcommand(stream)
         self.sendcommand(b'\x81\x02\x01\x05')
-        pages = self.page_data(BOOTLOADER203, 128)
-        for page in pages:
-            self.dev.write(CH_EP_OUT_RAW, page)
+        self.writeraw(self.getbootloader(BOOTLOADER203))
         self.sendcommand(b'\x81\x02\x01\x07')
         self.sendcommand(b'\x81\x02\x01\x04')
-        pages = self.page_data(data, 256)
-        for page in pages:
-            self.dev.write(CH_EP_OUT_RAW, page)
-        reply = self.dev.read(CH_EP_IN_RAW, CH_PACKET_SIZE, CH_TIMEOUT)
-        if set(reply) != set((0x41, 0x01, 0x01, 0x04)):
+        self.writeraw(data)
+        reply = self.usbread(CH_EP_IN_RAW, CH_PACKET_SIZE, CH_TIMEOUT)
+        if bytes(reply[:4]) != b'\x41\x01\x01\x04':
            raise Exception('Failed writing/verifying data blob')
 
     # Write data to code flash
@@ -401,6 +432,7 @@ CH_VENDOR_ID    = 0x1A86    # VID
 CH_PRODUCT_ID   = 0x8010    # PID in RISC-V mode
 CH_ARM_ID       = 0x8012    # PID in ARM mode
 CH_PACKET_SIZE  = 1024      # packet size
+CH_MAX_TRANSFER = 65536     # max bytes per raw bulk transfer
 CH_INTERFACE    = 0         # interface number
 CH_EP_OUT       = 0x01      # endpoint for command transfer out
 CH_EP_IN        = 0x81      # endpoint for reply transfer in
@@ -408,6 +440,12 @@ CH_EP_OUT_RAW   = 0x02      # endpoint for raw data transfer out
 CH_EP_IN_RAW    = 0x82      # endpoint for raw data transfer in
 CH_TIMEOUT      = 5000      # timeout for USB operations
 
+# Command stream formats
+CH_CMD_BLOB     = struct.Struct('>3sII')    # blob header: command, address, length
+CH_CMD_REG      = struct.Struct('>BBBBIB')  # register access: command, addr, data, op
+CH_U16_BE       = struct.Struct('>H')       # 16-bit reply field
+CH_U32_BE       = struct.Struct('>I')       # 32-bit reply field
+
 # Memory constants
 CH_RAM_BASE     = 0x20000000
 CH_CODE_BASE    = 0x08000000
@@ -417,66 +455,71 @@ CH_BOOT_BASE    = 0x1FFFF000
 # Flash Bootloader
 # ===================================================================================
 
-BOOTLOADER003 = \
-     b"\x21\x11\x22\xca\x26\xc8\x93\x77\x15\x00\x99\xcf\xb7\x06\x67\x45" \
-    +b"\xb7\x27\x02\x40\x93\x86\x36\x12\x37\x97\xef\xcd\xd4\xc3\x13\x07" \
-    +b"\xb7\x9a\xd8\xc3\xd4\xd3\xd8\xd3\x93\x77\x25\x00\x9d\xc7\xb7\x27" \
-    +b"\x02\x40\x98\x4b\xad\x66\x37\x33\x00\x40\x13\x67\x47\x00\x98\xcb" \
-    +b"\x98\x4b\x93\x86\xa6\xaa\x13\x67\x07\x04\x98\xcb\xd8\x47\x05\x8b" \
-    +b"\x63\x16\x07\x10\x98\x4b\x6d\x9b\x98\xcb\x93\x77\x45\x00\xa9\xcb" \
-    +b"\x93\x07\xf6\x03\x99\x83\x2e\xc0\x2d\x63\x81\x76\x3e\xc4\xb7\x32" \
-    +b"\x00\x40\xb7\x27\x02\x40\x13\x03\xa3\xaa\xfd\x16\x98\x4b\xb7\x03" \
-    +b"\x02\x00\x33\x67\x77\x00\x98\xcb\x02\x47\xd8\xcb\x98\x4b\x13\x67" \
-    +b"\x07\x04\x98\xcb\xd8\x47\x05\x8b\x69\xe7\x98\x4b\x75\x8f\x98\xcb" \
-    +b"\x02\x47\x13\x07\x07\x04\x3a\xc0\x22\x47\x7d\x17\x3a\xc4\x79\xf7" \
-    +b"\x93\x77\x85\x00\xf1\xcf\x93\x07\xf6\x03\x2e\xc0\x99\x83\x37\x27" \
-    +b"\x02\x40\x3e\xc4\x1c\x4b\xc1\x66\x2d\x63\xd5\x8f\x1c\xcb\x37\x07" \
-    +b"\x00\x20\x13\x07\x07\x20\xb7\x27\x02\x40\xb7\x03\x08\x00\xb7\x32" \
-    +b"\x00\x40\x13\x03\xa3\xaa\x94\x4b\xb3\xe6\x76\x00\x94\xcb\xd4\x47" \
-    +b"\x85\x8a\xf5\xfe\x82\x46\xba\x84\x37\x04\x04\x00\x36\xc2\xc1\x46" \
-    +b"\x36\xc6\x92\x46\x84\x40\x11\x07\x84\xc2\x94\x4b\xc1\x8e\x94\xcb" \
-    +b"\xd4\x47\x85\x8a\xb1\xea\x92\x46\xba\x84\x91\x06\x36\xc2\xb2\x46" \
-    +b"\xfd\x16\x36\xc6\xf9\xfe\x82\x46\xd4\xcb\x94\x4b\x93\xe6\x06\x04" \
-    +b"\x94\xcb\xd4\x47\x85\x8a\x85\xee\xd4\x47\xc1\x8a\x85\xce\xd8\x47" \
-    +b"\xb7\x06\xf3\xff\xfd\x16\x13\x67\x07\x01\xd8\xc7\x98\x4b\x21\x45" \
-    +b"\x75\x8f\x98\xcb\x52\x44\xc2\x44\x61\x01\x02\x90\x23\x20\xd3\x00" \
-    +b"\xf5\xb5\x23\xa0\x62\x00\x3d\xb7\x23\xa0\x62\x00\x55\xb7\x23\xa0" \
-    +b"\x62\x00\xc1\xb7\x82\x46\x93\x86\x06\x04\x36\xc0\xa2\x46\xfd\x16" \
-    +b"\x36\xc4\xb5\xf2\x98\x4b\xb7\x06\xf3\xff\xfd\x16\x75\x8f\x98\xcb" \
-    +b"\x41\x89\x05\xcd\x2e\xc0\x0d\x06\x02\xc4\x09\x82\xb7\x07\x00\x20" \
-    +b"\x32\xc6\x93\x87\x07\x20\x98\x43\x13\x86\x47\x00\xa2\x47\x82\x46" \
-    +b"\x8a\x07\xb6\x97\x9c\x43\x63\x1c\xf7\x00\xa2\x47\x85\x07\x3e\xc4" \
-    +b"\xa2\x46\x32\x47\xb2\x87\xe3\xe0\xe6\xfe\x01\x45\x61\xb7\x41\x45" \
-    +b"\x51\xb7"
-
-
-BOOTLOADER203 = \
-     b"\x93\x77\x15\x00\x41\x11\x99\xcf\xb7\x06\x67\x45\xb7\x27\x02\x40" \
-    +b"\x93\x86\x36\x12\x37\x97\xef\xcd\xd4\xc3\x13\x07\xb7\x9a\xd8\xc3" \
-    +b"\xd4\xd3\xd8\xd3\x93\x77\x25\x00\x95\xc7\xb7\x27\x02\x40\x98\x4b" \
-    +b"\xad\x66\x37\x38\x00\x40\x13\x67\x47\x00\x98\xcb\x98\x4b\x93\x86" \
-    +b"\xa6\xaa\x13\x67\x07\x04\x98\xcb\xd8\x47\x05\x8b\x61\xeb\x98\x4b" \
-    +b"\x6d\x9b\x98\xcb\x93\x77\x45\x00\xa9\xcb\x93\x07\xf6\x0f\xa1\x83" \
-    +b"\x2e\xc0\x2d\x68\x81\x76\x3e\xc4\xb7\x08\x02\x00\xb7\x27\x02\x40" \
-    +b"\x37\x33\x00\x40\x13\x08\xa8\xaa\xfd\x16\x98\x4b\x33\x67\x17\x01" \
-    +b"\x98\xcb\x02\x47\xd8\xcb\x98\x4b\x13\x67\x07\x04\x98\xcb\xd8\x47" \
-    +b"\x05\x8b\x41\xeb\x98\x4b\x75\x8f\x98\xcb\x02\x47\x13\x07\x07\x10" \
-    +b"\x3a\xc0\x22\x47\x7d\x17\x3a\xc4\x69\xfb\x93\x77\x85\x00\xd5\xcb" \
-    +b"\x93\x07\xf6\x0f\x2e\xc0\xa1\x83\x3e\xc4\x37\x27\x02\x40\x1c\x4b" \
-    +b"\xc1\x66\x41\x68\xd5\x8f\x1c\xcb\xb7\x16\x00\x20\xb7\x27\x02\x40" \
-    +b"\x93\x08\x00\x04\x37\x03\x20\x00\x98\x4b\x33\x67\x07\x01\x98\xcb" \
-    +b"\xd8\x47\x05\x8b\x75\xff\x02\x47\x3a\xc2\x46\xc6\x32\x47\x0d\xef" \
-    +b"\x98\x4b\x33\x67\x67\x00\x98\xcb\xd8\x47\x05\x8b\x75\xff\xd8\x47" \
-    +b"\x41\x8b\x39\xc3\xd8\x47\xc1\x76\xfd\x16\x13\x67\x07\x01\xd8\xc7" \
-    +b"\x98\x4b\x21\x45\x75\x8f\x98\xcb\x41\x01\x02\x90\x23\x20\xd8\x00" \
-    +b"\x25\xb7\x23\x20\x03\x01\xa5\xb7\x12\x47\x13\x8e\x46\x00\x94\x42" \
-    +b"\x14\xc3\x12\x47\x11\x07\x3a\xc2\x32\x47\x7d\x17\x3a\xc6\xd8\x47" \
-    +b"\x09\x8b\x75\xff\xf2\x86\x5d\xb7\x02\x47\x13\x07\x07\x10\x3a\xc0" \
-    +b"\x22\x47\x7d\x17\x3a\xc4\x49\xf3\x98\x4b\xc1\x76\xfd\x16\x75\x8f" \
-    +b"\x98\xcb\x41\x89\x15\xc9\x2e\xc0\x0d\x06\x02\xc4\x09\x82\x32\xc6" \
-    +b"\xb7\x17\x00\x20\x98\x43\x13\x86\x47\x00\xa2\x47\x82\x46\x8a\x07" \
-    +b"\xb6\x97\x9c\x43\x63\x1c\xf7\x00\xa2\x47\x85\x07\x3e\xc4\xa2\x46" \
-    +b"\x32\x47\xb2\x87\xe3\xe0\xe6\xfe\x01\x45\xbd\xbf\x41\x45\xad\xbf"
+# Stored as hex strings, only the one needed is decoded when flashing
+
+BOOTLOADER003 = (
+    "21 11 22 ca 26 c8 93 77 15 00 99 cf b7 06 67 45"
+    "b7 27 02 40 93 86 36 12 37 97 ef cd d4 c3 13 07"
+    "b7 9a d8 c3 d4 d3 d8 d3 93 77 25 00 9d c7 b7 27"
+    "02 40 98 4b ad 66 37 33 00 40 13 67 47 00 98 cb"
+    "98 4b 93 86 a6 aa 13 67 07 04 98 cb d8 47 05 8b"
+    "63 16 07 10 98 4b 6d 9b 98 cb 93 77 45 00 a9 cb"
+    "93 07 f6 03 99 83 2e c0 2d 63 81 76 3e c4 b7 32"
+    "00 40 b7 27 02 40 13 03 a3 aa fd 16 98 4b b7 03"
+    "02 00 33 67 77 00 98 cb 02 47 d8 cb 98 4b 13 67"
+    "07 04 98 cb d8 47 05 8b 69 e7 98 4b 75 8f 98 cb"
+    "02 47 13 07 07 04 3a c0 22 47 7d 17 3a c4 79 f7"
+    "93 77 85 00 f1 cf 93 07 f6 03 2e c0 99 83 37 27"
+    "02 40 3e c4 1c 4b c1 66 2d 63 d5 8f 1c cb 37 07"
+    "00 20 13 07 07 20 b7 27 02 40 b7 03 08 00 b7 32"
+    "00 40 13 03 a3 aa 94 4b b3 e6 76 00 94 cb d4 47"
+    "85 8a f5 fe 82 46 ba 84 37 04 04 00 36 c2 c1 46"
+    "36 c6 92 46 84 40 11 07 84 c2 94 4b c1 8e 94 cb"
+    "d4 47 85 8a b1 ea 92 46 ba 84 91 06 36 c2 b2 46"
+    "fd 16 36 c6 f9 fe 82 46 d4 cb 94 4b 93 e6 06 04"
+    "94 cb d4 47 85 8a 85 ee d4 47 c1 8a 85 ce d8 47"
+    "b7 06 f3 ff fd 16 13 67 07 01 d8 c7 98 4b 21 45"
+    "75 8f 98 cb 52 44 c2 44 61 01 02 90 23 20 d3 00"
+    "f5 b5 23 a0 62 00 3d b7 23 a0 62 00 55 b7 23 a0"
+    "62 00 c1 b7 82 46 93 86 06 04 36 c0 a2 46 fd 16"
+    "36 c4 b5 f2 98 4b b7 06 f3 ff fd 16 75 8f 98 cb"
+    "41 89 05 cd 2e c0 0d 06 02 c4 09 82 b7 07 00 20"
+    "32 c6 93 87 07 20 98 43 13 86 47 00 a2 47 82 46"
+    "8a 07 b6 97 9c 43 63 1c f7 00 a2 47 85 07 3e c4"
+    "a2 46 32 47 b2 87 e3 e0 e6 fe 01 45 61 b7 41 45"
+    "51 b7")
+
+
+BOOTLOADER203 = (
+    "93 77 15 00 41 11 99 cf b7 06 67 45 b7 27 02 40"
+    "93 86 36 12 37 97 ef cd d4 c3 13 07 b7 9a d8 c3"
+    "d4 d3 d8 d3 93 77 25 00 95 c7 b7 27 02 40 98 4b"
+    "ad 66 37 38 00 40 13 67 47 00 98 cb 98 4b 93 86"
+    "a6 aa 13 67 07 04 98 cb d8 47 05 8b 61 eb 98 4b"
+    "6d 9b 98 cb 93 77 45 00 a9 cb 93 07 f6 0f a1 83"
+    "2e c0 2d 68 81 76 3e c4 b7 08 02 00 b7 27 02 40"
+    "37 33 00 40 13 08 a8 aa fd 16 98 4b 33 67 17 01"
+    "98 cb 02 47 d8 cb 98 4b 13 67 07 04 98 cb d8 47"
+    "05 8b 41 eb 98 4b 75 8f 98 cb 02 47 13 07 07 10"
+    "3a c0 22 47 7d 17 3a c4 69 fb 93 77 85 00 d5 cb"
+    "93 07 f6 0f 2e c0 a1 83 3e c4 37 27 02 40 1c 4b"
+    "c1 66 41 68 d5 8f 1c cb b7 16 00 20 b7 27 02 40"
+    "93 08 00 04 37 03 20 00 98 4b 33 67 07 01 98 cb"
+    "d8 47 05 8b 75 ff 02 47 3a c2 46 c6 32 47 0d ef"
+    "98 4b 33 67 67 00 98 cb d8 47 05 8b 75 ff d8 47"
+    "41 8b 39 c3 d8 47 c1 76 fd 16 13 67 07 01 d8 c7"
+    "98 4b 21 45 75 8f 98 cb 41 01 02 90 23 20 d8 00"
+    "25 b7 23 20 03 01 a5 b7 12 47 13 8e 46 00 94 42"
+    "14 c3 12 47 11 07 3a c2 32 47 7d 17 3a c6 d8 47"
+    "09 8b 75 ff f2 86 5d b7 02 47 13 07 07 10 3a c0"
+    "22 47 7d 17 3a c4 49 f3 98 4b c1 76 fd 16 75 8f"
+    "98 cb 41 89 15 c9 2e c0 0d 06 02 c4 09 82 32 c6"
+    "b7 17 00 20 98 43 13 86 47 00 a2 47 82 46 8a 07"
+    "b6 97 9c 43 63 1c f7 00 a2 47 85 07 3e c4 a2 46"
+    "32 47 b2 87 e3 e0 e6 fe 01 45 bd bf 41 45 ad bf")
+
+# Decoded and padded bootloaders, filled by Programmer.getbootloader()
+BOOTLOADER_CACHE = dict()
 
 # ===================================================================================
 